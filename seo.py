@@ -1,97 +1,342 @@
 # seo.py
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 import csv
+import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urljoin, urlparse
-import time
 from datetime import datetime
 
-# === CONFIGURATION (User Input) ===
-BASE_URL = input("Enter your WordPress site URL (e.g., https://yoursite.com): ").strip()
-if not BASE_URL.startswith("http"):
-    BASE_URL = "https://" + BASE_URL
-
-OUTPUT_FILE = f"seo_report_{urlparse(BASE_URL).netloc}.csv"
-HTML_FILE = f"seo_report_{urlparse(BASE_URL).netloc}.html"
+# === CONFIGURATION ===
 PER_PAGE = 50
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; SEO Analyzer/1.0)"
 }
 TIMEOUT = 10
+# REST API calls back off on transient errors and honor Retry-After
+API_CONCURRENCY = 8
+API_RETRIES = 5
+API_BACKOFF = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+FETCH_CONCURRENCY = 32
+HEAD_END_RE = re.compile(rb'</head\s*>', re.I)
+# Matched against the already-lowercased <head>, so no re.I needed
+OG_TITLE_RE = re.compile(rb'<meta[^>]+property\s*=\s*["\']?og:title["\'\s/>]')
+TWITTER_CARD_RE = re.compile(rb'<meta[^>]+name\s*=\s*["\']?twitter:card["\'\s/>]')
+BREADCRUMB_SCHEMA_RE = re.compile(rb'"@type"\s*:\s*"BreadcrumbList"')
+BREADCRUMB_CLASS_RE = re.compile(rb'class\s*=\s*["\']?[^"\'>]*breadcrumb', re.I)
+BREADCRUMB_TEXT_RE = re.compile('breadcrumb', re.I)
+# Only build the tags analyze_html() actually looks at
+PARSE_ONLY = SoupStrainer(['title', 'h1', 'meta', 'img', 'nav'])
+PLACEHOLDER_IMG_PREFIXES = ('data:image/gif;base64',)
+CSV_FIELDS = (
+    'Type', 'Title', 'URL', 'Page Title', 'H1 Count', 'H1 Text', 'Meta Description',
+    'NoIndex', 'OG Tags', 'Twitter Card', 'Missing Alt Count', 'Missing Alt Image URLs',
+    'Breadcrumb Schema', 'Breadcrumb HTML', 'Issues Summary', 'Issues Detail'
+)
+MAX_ALT_PREVIEWS = 10
+# Report severities: 0 = OK, 1 = warning, 2 = critical
+SEVERITY_COLORS = {0: "#f0f9f0", 1: "#fff8e1", 2: "#ffebee"}
+SEVERITY_LABELS = {0: "🟢 OK", 1: "🟡 Warning", 2: "🔴 Critical"}
+
+
+# =====================
+# HTML REPORT TEMPLATES
+# =====================
+# Only REPORT_HEAD and REPORT_SUMMARY have .format() fields; the rest are used as-is
+
+REPORT_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>SEO Audit Report: {base_url}</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;700&display=swap" rel="stylesheet">
+    <script src="https://cdn.tailwindcss.com"></script>
+"""
+
+REPORT_ASSETS = """    <style>
+        body { font-family: 'Roboto', sans-serif; }
+        .hover-expand { cursor: pointer; }
+        .issue-list { padding-left: 20px; margin: 8px 0; font-size: 0.95em; }
+        .img-preview { max-width: 120px; max-height: 80px; object-fit: cover; border-radius: 4px; }
+        .hidden { display: none; }
+        .search-box input { width: 100%; padding: 10px; border: 1px solid #ccc; border-radius: 6px; }
+    </style>
+    <script>
+        function toggleRow(id) { document.getElementById('details-'+id).classList.toggle('hidden'); }
+        function filterTable() {
+            const q = document.getElementById('search').value.toLowerCase();
+            document.querySelectorAll('[data-search]').forEach(r => {
+                r.style.display = r.getAttribute('data-search').toLowerCase().includes(q) ? '' : 'none';
+            });
+        }
+    </script>
+</head>
+<body class="bg-gray-50 text-gray-800">
+    <div class="max-w-6xl mx-auto p-6">
+
+"""
+
+REPORT_SUMMARY = """        <!-- Header -->
+        <h1 class="text-3xl font-bold text-center mb-2">SEO Audit Report</h1>
+        <p class="text-center text-gray-600 mb-6">Generated on {generated} | Site: <strong>{base_url}</strong></p>
+
+        <!-- Search -->
+        <div class="search-box mb-4">
+            <input type="text" id="search" placeholder="🔍 Filter by URL, issue, image..." onkeyup="filterTable()">
+        </div>
+
+        <!-- Stats -->
+        <div class="grid grid-cols-2 md:grid-cols-4 gap-4 my-6 text-center">
+            <div class="bg-white p-4 rounded shadow">
+                <strong class="text-xl">{total_pages}</strong><br>
+                <span class="text-sm text-gray-600">Pages Scanned</span>
+            </div>
+            <div class="bg-green-100 p-4 rounded shadow">
+                <strong class="text-xl">{clean_pages}</strong><br>
+                <span class="text-sm text-gray-600">Fully OK</span>
+            </div>
+            <div class="bg-yellow-100 p-4 rounded shadow">
+                <strong class="text-xl">{issue_pages}</strong><br>
+                <span class="text-sm text-gray-600">With Issues</span>
+            </div>
+            <div class="bg-red-100 p-4 rounded shadow">
+                <strong class="text-xl">{critical_pages}</strong><br>
+                <span class="text-sm text-gray-600">Critical Issues</span>
+            </div>
+        </div>
+
+        <!-- Table -->
+        <table class="w-full border-collapse shadow-md bg-white">
+            <thead class="bg-gray-100 text-left uppercase text-sm font-semibold">
+                <tr>
+                    <th class="py-3 px-4">Status</th>
+                    <th class="py-3 px-4">Page Title</th>
+                    <th class="py-3 px-4">Type</th>
+                    <th class="py-3 px-4">Issues</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+
+ALT_PREVIEWS_OPEN = """
+                <p><strong>Images Missing Alt Text:</strong></p>
+                <div class="flex flex-wrap gap-3 mt-2">
+            """
+
+ROW_CLOSE = """
+                </div>
+            </td>
+        </tr>
+        """
+
+STRENGTHS_OPEN = """
+            </tbody>
+        </table>
+
+        <!-- What’s Working Well -->
+        <div class="mt-12 p-6 bg-green-50 border-l-4 border-green-400">
+            <h2 class="text-2xl font-bold text-gray-800 mb-4">What’s Working Well</h2>
+            <p class="text-gray-700 mb-4">The following SEO best practices are correctly implemented across your site:</p>
+            <ul class="space-y-2 text-gray-700">
+    """
+
+REPORT_FOOTER = """
+            </ul>
+        </div>
+
+        <p class="text-center mt-8 text-sm text-gray-500">
+            Custom SEO Analyzer for WordPress by Victoria and Qwen
+        </p>
+    </div>
+</body>
+</html>
+"""
 
 
 # =====================
 # SEO ANALYSIS FUNCTIONS
 # =====================
 
-def get_all_wordpress_urls(base_url):
+def content_type_of(endpoint):
+    """Name the content type served by a REST API endpoint"""
+    return "post" if "posts" in endpoint else "page"
+
+
+async def api_get(session, endpoint, params):
+    """GET a REST API URL, backing off on transient errors and honoring Retry-After"""
+    for attempt in range(API_RETRIES + 1):
+        delay = API_BACKOFF * 2 ** attempt
+        try:
+            async with session.get(endpoint, params=params) as response:
+                if response.status not in RETRY_STATUSES or attempt == API_RETRIES:
+                    return response.status, response.headers, str(response.url), await response.text()
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = int(retry_after)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == API_RETRIES:
+                raise
+        await asyncio.sleep(delay)
+
+
+async def fetch_listing_page(session, endpoint, page):
+    """Fetch one page of posts/pages; returns (items, total_pages)
+
+    items is None when the page could not be used, and total_pages is None
+    when the server does not send X-WP-TotalPages.
+    """
+    content_type = content_type_of(endpoint)
+    params = {'per_page': PER_PAGE, 'page': page, 'status': 'publish'}
+    try:
+        status, headers, url, text = await api_get(session, endpoint, params)
+    except Exception as e:
+        print(f"  ❌ Request failed: {str(e) or type(e).__name__}")
+        return None, None
+
+    # Stop if 400/404 and not first page
+    if status in [400, 404] and page > 1:
+        print(f"  → Pagination ended (status {status})")
+        return None, None
+    if status >= 400:
+        print(f"  ❌ {status} from {url}")
+        if page == 1:
+            print("     ⚠️ Check if REST API is blocked or site is down.")
+        return None, None
+
+    try:
+        items = json.loads(text)
+    except ValueError:
+        print(f"  ❌ Failed to parse JSON: {text[:200]}...")
+        if page == 1:
+            print("     🔐 Likely blocked by security plugin or redirect.")
+        return None, None
+    if not isinstance(items, list):
+        print(f"  ⚠️ Unexpected response format: {text[:200]}...")
+        return None, None
+
+    if items:
+        print(f"  ✅ Page {page}: {len(items)} {content_type}(s)")
+    total_pages = headers.get('X-WP-TotalPages')
+    return items, int(total_pages) if total_pages and total_pages.isdigit() else None
+
+
+async def get_all_wordpress_urls(base_url):
     """Fetch all published posts and pages using WordPress REST API"""
     api_url = urljoin(base_url, "/wp-json/wp/v2/")
     endpoints = [urljoin(api_url, "posts"), urljoin(api_url, "pages")]
-    urls = []
-
-    for endpoint in endpoints:
-        page = 1
-        content_type = "post" if "posts" in endpoint else "page"
-        print(f"🔍 Fetching {content_type}s from: {endpoint}")
-
-        while True:
-            try:
-                params = {'per_page': PER_PAGE, 'page': page, 'status': 'publish'}
-                response = requests.get(endpoint, params=params, headers=HEADERS, timeout=TIMEOUT)
-
-                # Stop if 400/404 and not first page
-                if response.status_code in [400, 404] and page > 1:
-                    print(f"  → Pagination ended (status {response.status_code})")
-                    break
-                if not response.ok:
-                    print(f"  ❌ {response.status_code} from {response.url}")
-                    if page == 1:
-                        print("     ⚠️ Check if REST API is blocked or site is down.")
-                    break
-
-                try:
-                    items = response.json()
-                    if not isinstance(items, list):
-                        print(f"  ⚠️ Unexpected response format: {response.text[:200]}...")
-                        break
-                    if not items:
-                        break
-                except requests.exceptions.JSONDecodeError:
-                    print(f"  ❌ Failed to parse JSON: {response.text[:200]}...")
-                    if page == 1:
-                        print("     🔐 Likely blocked by security plugin or redirect.")
-                    break
-
-                for item in items:
-                    urls.append({
-                        'title': item.get('title', {}).get('rendered', 'No Title'),
-                        'url': item.get('link'),
-                        'type': content_type
-                    })
-
-                print(f"  ✅ Page {page}: {len(items)} {content_type}(s)")
+    listing = {}  # (endpoint, page) -> items
+    semaphore = asyncio.Semaphore(API_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        async def bounded_fetch(endpoint, page):
+            async with semaphore:
+                return await fetch_listing_page(session, endpoint, page)
+
+        for endpoint in endpoints:
+            print(f"🔍 Fetching {content_type_of(endpoint)}s from: {endpoint}")
+
+        # Page 1 of each endpoint tells us how many pages there are...
+        first_pages = await asyncio.gather(*(bounded_fetch(endpoint, 1) for endpoint in endpoints))
+
+        # ...so every remaining page can be requested in a single wave
+        remaining = []
+        for endpoint, (items, total_pages) in zip(endpoints, first_pages):
+            listing[(endpoint, 1)] = items
+            if items and total_pages:
+                remaining += [(endpoint, page) for page in range(2, total_pages + 1)]
+        rest = await asyncio.gather(*(bounded_fetch(endpoint, page) for endpoint, page in remaining))
+        for key, (items, _) in zip(remaining, rest):
+            listing[key] = items
+
+        # Without X-WP-TotalPages, page through one request at a time until the end
+        async def page_through(endpoint, items):
+            page = 1
+            while items and len(items) == PER_PAGE:
                 page += 1
-                time.sleep(0.1)
+                items, _ = await bounded_fetch(endpoint, page)
+                listing[(endpoint, page)] = items
+
+        await asyncio.gather(*(page_through(endpoint, items)
+                               for endpoint, (items, total_pages) in zip(endpoints, first_pages)
+                               if total_pages is None))
 
-            except Exception as e:
-                print(f"  ❌ Request failed: {e}")
-                break
+    urls = []
+    for endpoint, page in sorted(listing, key=lambda key: (endpoints.index(key[0]), key[1])):
+        for item in listing[(endpoint, page)] or []:
+            urls.append({
+                'title': item.get('title', {}).get('rendered', 'No Title'),
+                'url': item.get('link'),
+                'type': content_type_of(endpoint)
+            })
 
     return urls
 
 
+async def fetch(session, url):
+    """Fetch a single page, returning its raw HTML bytes or the exception that occurred"""
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return url, await response.read()
+    except asyncio.TimeoutError:
+        return url, TimeoutError(f"Timed out after {TIMEOUT}s")
+    except Exception as e:
+        return url, e
+
+
+async def audit_pages(pages, executor, on_report):
+    """Fetch and analyze pages concurrently, calling on_report(index, page, report) as each finishes
+
+    Each page's HTML is only held while that page is in flight, so memory stays
+    bounded by FETCH_CONCURRENCY rather than by the size of the site.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        async def process(i, page):
+            async with semaphore:
+                print(f"[{i + 1}/{len(pages)}] Checking: {page['url']}")
+                url, html = await fetch(session, page['url'])
+                if isinstance(html, Exception):
+                    return i, page, failed_report(html)
+                # Parsing is CPU-bound, so hand it to the process pool
+                return i, page, await loop.run_in_executor(executor, analyze_one, (url, html))
+
+        tasks = [asyncio.create_task(process(i, page)) for i, page in enumerate(pages)]
+        for done in asyncio.as_completed(tasks):
+            on_report(*await done)
+
+
 def analyze_html(html, url):
-    """Analyze SEO elements in the HTML"""
-    soup = BeautifulSoup(html, 'html.parser')
-    base_domain = '/'.join(url.split('/')[:3])
+    """Analyze SEO elements in the HTML (raw bytes; the parser detects the encoding)"""
+    try:
+        soup = BeautifulSoup(html, 'lxml', parse_only=PARSE_ONLY)
+    except FeatureNotFound:
+        # lxml not installed: fall back to the (slower) pure-Python parser
+        soup = BeautifulSoup(html, 'html.parser', parse_only=PARSE_ONLY)
+    parsed = urlparse(url)
+    base_domain = f"{parsed.scheme}://{parsed.netloc}"
+
+    # Robots/OG/Twitter meta live in <head>: lowercase it once and share it between those checks
+    head_end = HEAD_END_RE.search(html)
+    head_lower = html[:head_end.start() if head_end else len(html)].lower()
 
     report = {
         'title_tag': '',
         'h1_count': 0,
         'h1_text': '',
         'meta_description': 'Missing',
+        'title_length': 0,
+        'meta_description_length': 0,
         'noindex': False,
         'has_og': False,
         'has_twitter': False,
@@ -108,7 +353,7 @@ def analyze_html(html, url):
     if title_tag:
         text = title_tag.get_text().strip()
         report['title_tag'] = text
-        length = len(text)
+        length = report['title_length'] = len(text)
         if length < 30:
             report['issues'].append("Title too short")
             report['issues_detail'].append(f"Title too short ({length} chars): {text}")
@@ -136,52 +381,46 @@ def analyze_html(html, url):
     if meta_desc and meta_desc.get('content'):
         desc = meta_desc['content'].strip()
         report['meta_description'] = desc
-        if len(desc) < 50:
+        length = report['meta_description_length'] = len(desc)
+        if length < 50:
             report['issues'].append("Meta desc too short")
-            report['issues_detail'].append(f"Meta description too short ({len(desc)} chars)")
-        elif len(desc) > 160:
+            report['issues_detail'].append(f"Meta description too short ({length} chars)")
+        elif length > 160:
             report['issues'].append("Meta desc too long")
-            report['issues_detail'].append(f"Meta description too long ({len(desc)} chars)")
+            report['issues_detail'].append(f"Meta description too long ({length} chars)")
     else:
         report['issues'].append("Missing meta description")
         report['issues_detail'].append("Missing meta description tag")
 
     # === noindex ===
-    if ('<meta name="robots" content="noindex' in html.lower() or
-        'content="noindex' in html.lower()):
+    if b'content="noindex' in head_lower:
         report['noindex'] = True
         report['issues'].append("NOINDEX")
         report['issues_detail'].append("Page is set to NOINDEX")
 
     # === Open Graph & Twitter ===
-    if soup.find('meta', property='og:title'):
+    if OG_TITLE_RE.search(head_lower):
         report['has_og'] = True
     else:
         report['issues'].append("Missing OG")
         report['issues_detail'].append("Missing Open Graph tags")
 
-    if soup.find('meta', attrs={'name': 'twitter:card'}):
+    if TWITTER_CARD_RE.search(head_lower):
         report['has_twitter'] = True
     else:
         report['issues'].append("Missing Twitter Card")
         report['issues_detail'].append("Missing Twitter Card meta tag")
 
     # === Image Alt Text ===
-    images = soup.find_all('img')
-    missing_alt = []
-    for img in images:
-        src = img.get('src')
-        alt = img.get('alt', '').strip()
-
-        # Skip placeholders and spacers
-        if not src:
-            continue
-        if 'image/gif;base64' in src or 'spacer' in src.lower():
-            continue
-
-        if not alt:
-            img_url = urljoin(base_domain, src)
-            missing_alt.append(img_url)
+    # Skip placeholders and spacers
+    missing_alt = [
+        urljoin(base_domain, src)
+        for img in soup.select('img[src]')
+        if (src := img.get('src'))
+        and not src.startswith(PLACEHOLDER_IMG_PREFIXES)
+        and 'spacer' not in src.lower()
+        and not (img.get('alt') or '').strip()
+    ]
 
     report['missing_alt_count'] = len(missing_alt)
     report['missing_alt_images'] = missing_alt
@@ -193,149 +432,71 @@ def analyze_html(html, url):
             report['issues_detail'].append(f"... and {len(missing_alt)-5} more")
 
     # === Breadcrumb Schema ===
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        try:
-            if '"@type":"BreadcrumbList"' in script.string:
-                report['has_breadcrumb_schema'] = True
-                break
-        except:
-            continue
+    # Existence check only, so search the raw HTML instead of walking every JSON-LD script
+    report['has_breadcrumb_schema'] = bool(BREADCRUMB_SCHEMA_RE.search(html))
     if not report['has_breadcrumb_schema']:
         report['issues'].append("Missing breadcrumb schema")
         report['issues_detail'].append("Missing breadcrumb schema (JSON-LD)")
 
     # === Breadcrumb HTML ===
-    breadcrumbs = soup.find_all(['nav'], string=lambda x: x and 'breadcrumb' in str(x).lower())
-    breadcrumbs += soup.find_all(class_=lambda x: x and 'breadcrumb' in str(x).lower())
-    if breadcrumbs:
+    # Breadcrumb classes can sit on any tag, which the parser skips, so check the raw HTML
+    # (bs4 matches a compiled regex natively instead of calling back into Python per tag)
+    if BREADCRUMB_CLASS_RE.search(html) or soup.find('nav', string=BREADCRUMB_TEXT_RE):
         report['has_breadcrumb_html'] = True
 
     report['status'] = "OK" if not report['issues'] else "ISSUE"
     return report
 
 
-def generate_html_report(results, base_url):
+def analyze_one(item):
+    """Analyze a single (url, html) pair; runs in a worker process"""
+    url, html = item
+    try:
+        return analyze_html(html, url)
+    except Exception as e:
+        return failed_report(e)
+
+
+def generate_html_report(results, base_url, html_file):
     """Generate a beautiful, self-contained HTML SEO report with only meaningful content"""
     total_pages = len(results)
-    clean_pages = len([r for r in results if r['Issues Summary'] == 'OK'])
-    has_h1_ok = len([r for r in results if 'Missing H1' not in r['Issues Detail']])
-    title_good = len([r for r in results if 'Title too short' not in r['Issues Detail'] and 'Title too long' not in r['Issues Detail']])
-
+    clean_pages = sum(r['_sev'] == 0 for r in results)
+    critical_pages = sum(r['_critical'] for r in results)
+    has_h1_ok = sum(r['_h1_ok'] for r in results)
+    title_good = sum(r['_title_ok'] for r in results)
     # Only count if meta desc exists AND is within 50–160 chars
-    meta_good = 0
-    for r in results:
-        issues = r['Issues Detail']
-        has_missing = 'Missing meta description tag' in issues
-        has_short = 'Meta description too short' in issues
-        has_long = 'Meta description too long' in issues
-        if not has_missing and not has_short and not has_long and r['Meta Description'] != 'Missing':
-            meta_good += 1
-
-    og_good = len([r for r in results if 'Missing OG' not in r['Issues Detail']])
-    twitter_good = len([r for r in results if 'Missing Twitter Card' not in r['Issues Detail']])
-    schema_good = len([r for r in results if 'Missing breadcrumb schema' not in r['Issues Detail']])
+    meta_good = sum(r['_meta_ok'] for r in results)
+    og_good = sum(r['_og'] for r in results)
+    twitter_good = sum(r['_tw'] for r in results)
+    schema_good = sum(r['_schema'] for r in results)
 
     # Sort by severity
-    def severity(r):
-        if 'noindex' in r['Issues Detail'].lower() or 'Missing H1' in r['Issues Detail']:
-            return 2
-        if 'OK' in r['Issues Summary']:
-            return 0
-        return 1
-
-    results.sort(key=severity, reverse=True)
-
-    def get_color(r):
-        if 'noindex' in r['Issues Detail'].lower() or 'Missing H1' in r['Issues Detail']:
-            return "#ffebee"
-        if 'OK' in r['Issues Summary']:
-            return "#f0f9f0"
-        return "#fff8e1"
+    results.sort(key=lambda r: r['_sev'], reverse=True)
 
     # Start building HTML
-    html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>SEO Audit Report: {base_url}</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;700&display=swap" rel="stylesheet">
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        body {{ font-family: 'Roboto', sans-serif; }}
-        .hover-expand {{ cursor: pointer; }}
-        .issue-list {{ padding-left: 20px; margin: 8px 0; font-size: 0.95em; }}
-        .img-preview {{ max-width: 120px; max-height: 80px; object-fit: cover; border-radius: 4px; }}
-        .hidden {{ display: none; }}
-        .search-box input {{ width: 100%; padding: 10px; border: 1px solid #ccc; border-radius: 6px; }}
-    </style>
-    <script>
-        function toggleRow(id) {{ document.getElementById('details-'+id).classList.toggle('hidden'); }}
-        function filterTable() {{
-            const q = document.getElementById('search').value.toLowerCase();
-            document.querySelectorAll('[data-search]').forEach(r => {{
-                r.style.display = r.getAttribute('data-search').toLowerCase().includes(q) ? '' : 'none';
-            }});
-        }}
-    </script>
-</head>
-<body class="bg-gray-50 text-gray-800">
-    <div class="max-w-6xl mx-auto p-6">
-
-        <!-- Header -->
-        <h1 class="text-3xl font-bold text-center mb-2">SEO Audit Report</h1>
-        <p class="text-center text-gray-600 mb-6">Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')} | Site: <strong>{base_url}</strong></p>
-
-        <!-- Search -->
-        <div class="search-box mb-4">
-            <input type="text" id="search" placeholder="🔍 Filter by URL, issue, image..." onkeyup="filterTable()">
-        </div>
-
-        <!-- Stats -->
-        <div class="grid grid-cols-2 md:grid-cols-4 gap-4 my-6 text-center">
-            <div class="bg-white p-4 rounded shadow">
-                <strong class="text-xl">{total_pages}</strong><br>
-                <span class="text-sm text-gray-600">Pages Scanned</span>
-            </div>
-            <div class="bg-green-100 p-4 rounded shadow">
-                <strong class="text-xl">{clean_pages}</strong><br>
-                <span class="text-sm text-gray-600">Fully OK</span>
-            </div>
-            <div class="bg-yellow-100 p-4 rounded shadow">
-                <strong class="text-xl">{len([r for r in results if r['Issues Summary'] != 'OK'])}</strong><br>
-                <span class="text-sm text-gray-600">With Issues</span>
-            </div>
-            <div class="bg-red-100 p-4 rounded shadow">
-                <strong class="text-xl">{sum(1 for r in results if 'noindex' in r['Issues Detail'].lower() or 'Missing H1' in r['Issues Detail'])}</strong><br>
-                <span class="text-sm text-gray-600">Critical Issues</span>
-            </div>
-        </div>
-
-        <!-- Table -->
-        <table class="w-full border-collapse shadow-md bg-white">
-            <thead class="bg-gray-100 text-left uppercase text-sm font-semibold">
-                <tr>
-                    <th class="py-3 px-4">Status</th>
-                    <th class="py-3 px-4">Page Title</th>
-                    <th class="py-3 px-4">Type</th>
-                    <th class="py-3 px-4">Issues</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
+    parts = [
+        REPORT_HEAD.format(base_url=base_url),
+        REPORT_ASSETS,
+        REPORT_SUMMARY.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            base_url=base_url,
+            total_pages=total_pages,
+            clean_pages=clean_pages,
+            issue_pages=total_pages - clean_pages,
+            critical_pages=critical_pages
+        )
+    ]
 
     # Add table rows
     for idx, r in enumerate(results):
-        bg = get_color(r)
+        bg = SEVERITY_COLORS[r['_sev']]
         short_title = r['Title'][:30] + "..." if len(r['Title']) > 30 else r['Title']
 
-        html += f"""
+        parts.append(f"""
         <tr class="hover-expand" data-search="{r['URL']} {r['Issues Detail']}" onclick="toggleRow('{idx}')">
             <td class="py-3 px-4" style="background-color: {bg}">
                 <strong>
-                    {'🟢 OK' if r['Issues Summary']=='OK' else '🔴 Critical' if 'noindex' in r['Issues Detail'].lower() or 'Missing H1' in r['Issues Detail'] else '🟡 Warning'}
+                    {SEVERITY_LABELS[r['_sev']]}
                 </strong>
             </td>
             <td class="py-3 px-4 font-medium">{short_title}</td>
@@ -348,99 +509,130 @@ def generate_html_report(results, base_url):
                     <p><strong>URL:</strong> <a href="{r['URL']}" target="_blank" class="text-blue-600 hover:underline">{r['URL']}</a></p>
                     <p><strong>Full Issues:</strong></p>
                     <ul class="issue-list">
-        """
+        """)
 
         for issue in r['Issues Detail'].split(' | '):
-            html += f"<li>• {issue}</li>"
+            parts.append(f"<li>• {issue}</li>")
 
-        if r['Missing Alt Image URLs']:
-            html += """
-                <p><strong>Images Missing Alt Text:</strong></p>
-                <div class="flex flex-wrap gap-3 mt-2">
-            """
-            for img in r['Missing Alt Image URLs'].split('; ')[:10]:
-                html += f'''
+        if r['_alt_previews']:
+            parts.append(ALT_PREVIEWS_OPEN)
+            for img in r['_alt_previews']:
+                parts.append(f'''
                     <div class="text-center">
                         <img src="{img}" alt="Missing alt" class="img-preview border">
                         <a href="{img}" target="_blank" class="text-xs text-gray-500 hover:text-blue-600">View</a>
                     </div>
-                '''
-            if len(r['Missing Alt Image URLs'].split('; ')) > 10:
-                html += f"<p class='text-xs'>... and {len(r['Missing Alt Image URLs'].split('; ')) - 10} more</p>"
-            html += "</div>"
+                ''')
+            if r['Missing Alt Count'] > MAX_ALT_PREVIEWS:
+                parts.append(f"<p class='text-xs'>... and {r['Missing Alt Count'] - MAX_ALT_PREVIEWS} more</p>")
+            parts.append("</div>")
 
-        html += """
-                </div>
-            </td>
-        </tr>
-        """
+        parts.append(ROW_CLOSE)
 
-    html += """
-            </tbody>
-        </table>
-
-        <!-- What’s Working Well -->
-        <div class="mt-12 p-6 bg-green-50 border-l-4 border-green-400">
-            <h2 class="text-2xl font-bold text-gray-800 mb-4">What’s Working Well</h2>
-            <p class="text-gray-700 mb-4">The following SEO best practices are correctly implemented across your site:</p>
-            <ul class="space-y-2 text-gray-700">
-    """
+    parts.append(STRENGTHS_OPEN)
 
     any_strength = False
 
     if has_h1_ok == total_pages:
-        html += f"<li>🟢 All {total_pages} pages include an H1 tag</li>"
+        parts.append(f"<li>🟢 All {total_pages} pages include an H1 tag</li>")
         any_strength = True
     elif has_h1_ok > 0:
-        html += f"<li>🟢 {has_h1_ok}/{total_pages} pages include an H1 tag</li>"
+        parts.append(f"<li>🟢 {has_h1_ok}/{total_pages} pages include an H1 tag</li>")
         any_strength = True
 
     if title_good == total_pages:
-        html += f"<li>🟢 All {total_pages} pages have well-sized titles (50–60 characters)</li>"
+        parts.append(f"<li>🟢 All {total_pages} pages have well-sized titles (50–60 characters)</li>")
         any_strength = True
     elif title_good > 0:
-        html += f"<li>🟢 {title_good}/{total_pages} pages have well-sized titles</li>"
+        parts.append(f"<li>🟢 {title_good}/{total_pages} pages have well-sized titles</li>")
         any_strength = True
 
     if og_good == total_pages:
-        html += f"<li>🟢 All {total_pages} pages include Open Graph tags</li>"
+        parts.append(f"<li>🟢 All {total_pages} pages include Open Graph tags</li>")
         any_strength = True
     elif og_good > 0:
-        html += f"<li>🟢 {og_good}/{total_pages} pages include Open Graph tags</li>"
+        parts.append(f"<li>🟢 {og_good}/{total_pages} pages include Open Graph tags</li>")
         any_strength = True
 
     if twitter_good == total_pages:
-        html += f"<li>🟢 All {total_pages} pages support Twitter Cards</li>"
+        parts.append(f"<li>🟢 All {total_pages} pages support Twitter Cards</li>")
         any_strength = True
     elif twitter_good > 0:
-        html += f"<li>🟢 {twitter_good}/{total_pages} pages support Twitter Cards</li>"
+        parts.append(f"<li>🟢 {twitter_good}/{total_pages} pages support Twitter Cards</li>")
         any_strength = True
 
     if schema_good == total_pages:
-        html += f"<li>🟢 All {total_pages} pages include breadcrumb schema (JSON-LD)</li>"
+        parts.append(f"<li>🟢 All {total_pages} pages include breadcrumb schema (JSON-LD)</li>")
         any_strength = True
     elif schema_good > 0:
-        html += f"<li>🟢 {schema_good}/{total_pages} pages include breadcrumb schema (JSON-LD)</li>"
+        parts.append(f"<li>🟢 {schema_good}/{total_pages} pages include breadcrumb schema (JSON-LD)</li>")
         any_strength = True
 
     if not any_strength:
-        html += "<li>No major SEO strengths detected yet — but every fix brings you closer.</li>"
-
-    html += """
-            </ul>
-        </div>
+        parts.append("<li>No major SEO strengths detected yet — but every fix brings you closer.</li>")
 
-        <p class="text-center mt-8 text-sm text-gray-500">
-            Custom SEO Analyzer for WordPress by Victoria and Qwen
-        </p>
-    </div>
-</body>
-</html>
-"""
+    parts.append(REPORT_FOOTER)
 
-    with open(HTML_FILE, 'w', encoding='utf-8') as f:
+    html = "".join(parts)
+    with open(html_file, 'w', encoding='utf-8') as f:
         f.write(html)
-    return HTML_FILE
+    return html_file
+
+
+def failed_report(error):
+    """Build an empty report for a page that could not be fetched or analyzed"""
+    return {
+        'title_tag': '',
+        'h1_count': 0,
+        'h1_text': '',
+        'meta_description': '',
+        'title_length': 0,
+        'meta_description_length': 0,
+        'noindex': False,
+        'has_og': False,
+        'has_twitter': False,
+        'missing_alt_count': 0,
+        'missing_alt_images': [],
+        'has_breadcrumb_schema': False,
+        'has_breadcrumb_html': False,
+        'issues': [f"Failed to load: {str(error)}"],
+        'issues_detail': [f"Failed to load: {str(error)}"],
+        'status': "FAILED"
+    }
+
+
+def report_row(page, report):
+    """Flatten a page and its SEO report into a CSV row
+
+    Underscored fields are numeric flags for the HTML report and are not written to the CSV.
+    """
+    critical = report['noindex'] or (report['h1_count'] == 0 and report['status'] != "FAILED")
+    return {
+        'Type': page['type'],
+        'Title': page['title'],
+        'URL': page['url'],
+        'Page Title': report['title_tag'],
+        'H1 Count': report['h1_count'],
+        'H1 Text': report['h1_text'],
+        'Meta Description': report['meta_description'],
+        'NoIndex': 'Yes' if report['noindex'] else 'No',
+        'OG Tags': 'Yes' if report['has_og'] else 'No',
+        'Twitter Card': 'Yes' if report['has_twitter'] else 'No',
+        'Missing Alt Count': report['missing_alt_count'],
+        'Missing Alt Image URLs': '; '.join(report['missing_alt_images']),
+        'Breadcrumb Schema': 'Yes' if report['has_breadcrumb_schema'] else 'No',
+        'Breadcrumb HTML': 'Yes' if report['has_breadcrumb_html'] else 'No',
+        'Issues Summary': '; '.join(report['issues']) if report['issues'] else 'OK',
+        'Issues Detail': ' | '.join(report['issues_detail']),
+        '_h1_ok': int(report['h1_count'] > 0),
+        '_title_ok': int(30 <= report['title_length'] <= 60),
+        '_meta_ok': int(50 <= report['meta_description_length'] <= 160),
+        '_og': int(report['has_og']),
+        '_tw': int(report['has_twitter']),
+        '_schema': int(report['has_breadcrumb_schema']),
+        '_critical': int(critical),
+        '_sev': 2 if critical else (1 if report['issues'] else 0)
+    }
 
 
 # =====================
@@ -448,10 +640,18 @@ def generate_html_report(results, base_url):
 # =====================
 
 def main():
-    print(f"\n🔍 Starting SEO audit for: {BASE_URL}")
+    # === User Input ===
+    base_url = input("Enter your WordPress site URL (e.g., https://yoursite.com): ").strip()
+    if not base_url.startswith("http"):
+        base_url = "https://" + base_url
+
+    output_file = f"seo_report_{urlparse(base_url).netloc}.csv"
+    html_file = f"seo_report_{urlparse(base_url).netloc}.html"
+
+    print(f"\n🔍 Starting SEO audit for: {base_url}")
     print("Fetching all posts and pages...\n")
 
-    pages = get_all_wordpress_urls(BASE_URL)
+    pages = asyncio.run(get_all_wordpress_urls(base_url))
 
     if not pages:
         print("❌ No pages found. Check your URL or site accessibility.")
@@ -459,62 +659,36 @@ def main():
 
     print(f"✅ Found {len(pages)} pages. Analyzing...\n")
 
-    results = []
-    for i, page in enumerate(pages, 1):
-        print(f"[{i}/{len(pages)}] Checking: {page['url']}")
-        try:
-            response = requests.get(page['url'], headers=HEADERS, timeout=TIMEOUT)
-            response.raise_for_status()
-            report = analyze_html(response.text, page['url'])
-        except Exception as e:
-            report = {
-                'title_tag': '',
-                'h1_count': 0,
-                'h1_text': '',
-                'meta_description': '',
-                'noindex': False,
-                'has_og': False,
-                'has_twitter': False,
-                'missing_alt_count': 0,
-                'missing_alt_images': [],
-                'has_breadcrumb_schema': False,
-                'has_breadcrumb_html': False,
-                'issues': [f"Failed to load: {str(e)}"],
-                'issues_detail': [f"Failed to load: {str(e)}"]
-            }
-
-        results.append({
-            'Type': page['type'],
-            'Title': page['title'],
-            'URL': page['url'],
-            'Page Title': report['title_tag'],
-            'H1 Count': report['h1_count'],
-            'H1 Text': report['h1_text'],
-            'Meta Description': report['meta_description'],
-            'NoIndex': 'Yes' if report['noindex'] else 'No',
-            'OG Tags': 'Yes' if report['has_og'] else 'No',
-            'Twitter Card': 'Yes' if report['has_twitter'] else 'No',
-            'Missing Alt Count': report['missing_alt_count'],
-            'Missing Alt Image URLs': '; '.join(report['missing_alt_images']),
-            'Breadcrumb Schema': 'Yes' if report['has_breadcrumb_schema'] else 'No',
-            'Breadcrumb HTML': 'Yes' if report['has_breadcrumb_html'] else 'No',
-            'Issues Summary': '; '.join(report['issues']) if report['issues'] else 'OK',
-            'Issues Detail': ' | '.join(report['issues_detail'])
-        })
-
-    # Save CSV
+    # Rows are written to the CSV as soon as each page is analyzed
+    csv_file = None
     try:
-        keys = results[0].keys() if results else ['Type', 'Title', 'URL']
-        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(results)
-        print(f"📊 CSV report saved: {OUTPUT_FILE}")
+        csv_file = open(output_file, 'w', newline='', encoding='utf-8')
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
     except Exception as e:
         print(f"❌ Failed to save CSV: {e}")
 
+    results = [None] * len(pages)
+
+    def record(i, page, report):
+        row = report_row(page, report)
+        if csv_file:
+            writer.writerow(row)
+
+        # The HTML report only previews a few images, so don't keep the full list
+        del row['Missing Alt Image URLs']
+        row['_alt_previews'] = report['missing_alt_images'][:MAX_ALT_PREVIEWS]
+        results[i] = row
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        asyncio.run(audit_pages(pages, executor, record))
+
+    if csv_file:
+        csv_file.close()
+        print(f"📊 CSV report saved: {output_file}")
+
     # Generate HTML report
-    html_file = generate_html_report(results, BASE_URL)
+    generate_html_report(results, base_url, html_file)
     print(f"\n🎨 HTML report generated: {html_file}")
 
     # Open in browser
@@ -522,8 +696,8 @@ def main():
     webbrowser.open(f"file://{os.path.abspath(html_file)}")
 
     # Summary
-    issues = [r for r in results if r['Issues Summary'] != 'OK']
-    critical = sum(1 for r in results if 'noindex' in r['Issues Detail'].lower() or 'Missing H1' in r['Issues Detail'])
+    issues = [r for r in results if r['_sev'] > 0]
+    critical = sum(r['_critical'] for r in results)
     print(f"\n🎉 Audit complete!")
     print(f"📊 Total pages: {len(results)}")
     print(f"🔴 Critical: {critical}")